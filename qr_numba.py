@@ -0,0 +1,112 @@
+"""
+Numba-compiled QR mask scoring
+Replaces qrcode.util.lost_point on import, which is the hot loop of
+QRCode.make() (it runs once per mask pattern, eight times per code)
+"""
+
+import numpy as np
+from numba import njit
+from qrcode import util
+
+@njit(cache=True)
+def _score_runs(matrix, n):
+    # N1: runs of 5+ same-colour modules in a row or column
+    lost_point = 0
+    for row in range(n):
+        previous_color = matrix[row, 0]
+        length = 0
+        for col in range(n):
+            if matrix[row, col] == previous_color:
+                length += 1
+            else:
+                if length >= 5:
+                    lost_point += length - 2
+                length = 1
+                previous_color = matrix[row, col]
+        if length >= 5:
+            lost_point += length - 2
+
+    for col in range(n):
+        previous_color = matrix[0, col]
+        length = 0
+        for row in range(n):
+            if matrix[row, col] == previous_color:
+                length += 1
+            else:
+                if length >= 5:
+                    lost_point += length - 2
+                length = 1
+                previous_color = matrix[row, col]
+        if length >= 5:
+            lost_point += length - 2
+    return lost_point
+
+@njit(cache=True)
+def _score_blocks(matrix, n):
+    # N2: 2x2 blocks of one colour, with the same skip-ahead as qrcode
+    lost_point = 0
+    for row in range(n - 1):
+        col = 0
+        while col < n - 1:
+            top_right = matrix[row, col + 1]
+            if top_right != matrix[row + 1, col + 1]:
+                col += 2
+                continue
+            if top_right == matrix[row, col] and top_right == matrix[row + 1, col]:
+                lost_point += 3
+            col += 1
+    return lost_point
+
+@njit(cache=True)
+def _is_finder_like(line, i):
+    # 1:1:3:1:1 pattern with four light modules before or after
+    if line[i + 1] or not line[i + 4] or line[i + 5] or not line[i + 6] or line[i + 9]:
+        return False
+    if line[i] and line[i + 2] and line[i + 3] and not line[i + 7] and not line[i + 8] and not line[i + 10]:
+        return True
+    return (not line[i] and not line[i + 2] and not line[i + 3]
+            and line[i + 7] and line[i + 8] and line[i + 10])
+
+@njit(cache=True)
+def _score_finder_patterns(matrix, n):
+    # N3: finder-like patterns in rows and columns, with qrcode's skip-ahead
+    lost_point = 0
+    for row in range(n):
+        line = matrix[row, :]
+        i = 0
+        while i < n - 10:
+            if _is_finder_like(line, i):
+                lost_point += 40
+            i += 2 if line[i + 10] else 1
+
+    for col in range(n):
+        line = matrix[:, col]
+        i = 0
+        while i < n - 10:
+            if _is_finder_like(line, i):
+                lost_point += 40
+            i += 2 if line[i + 10] else 1
+    return lost_point
+
+@njit(cache=True)
+def score_mask(matrix):
+    """Penalty score (N1..N4) of a square uint8 module matrix"""
+    n = matrix.shape[0]
+    lost_point = _score_runs(matrix, n)
+    lost_point += _score_blocks(matrix, n)
+    lost_point += _score_finder_patterns(matrix, n)
+
+    # N4: every 5% departure from 50% dark modules
+    dark_count = 0
+    for row in range(n):
+        for col in range(n):
+            dark_count += matrix[row, col]
+    percent = dark_count / (n * n)
+    lost_point += int(abs(percent * 100 - 50) / 5) * 10
+    return lost_point
+
+def lost_point(modules):
+    """Drop-in for qrcode.util.lost_point taking the list-of-lists module grid"""
+    return int(score_mask(np.array(modules, dtype=np.uint8)))
+
+util.lost_point = lost_point
@@ -6,7 +6,6 @@ Includes QR code generation functionality
 """
 
 import http.server
-import socketserver
 import webbrowser
 import os
 import sys
@@ -15,146 +14,56 @@ import urllib.parse
 import argparse
 from pathlib import Path
 import io
-import base64
 import shutil
+import hashlib
+import string
+import functools
+import html
+import threading
+import gzip
+import socket
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Try to import QR code library
 try:
     import qrcode
     from qrcode.image.styledpil import StyledPilImage
     from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
+    from PIL import Image
     QR_AVAILABLE = True
 except ImportError:
     QR_AVAILABLE = False
 
-class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def end_headers(self):
-        # Add CORS headers
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        super().end_headers()
+# Optional Numba-compiled mask scoring (pip install numba), patches qrcode on import
+try:
+    import qr_numba
+except ImportError:
+    pass
 
-    def log_message(self, format, *args):
-        # Custom log format
-        print(f"[{self.address_string()}] {format % args}")
-    
-    def do_GET(self):
-        # Handle QR generator routes
-        if self.path.startswith('/qr/'):
-            self.handle_qr_request()
-        elif self.path == '/generator' or self.path == '/generator/':
-            self.serve_qr_generator_page()
-        else:
-            # Default file serving
-            super().do_GET()
-    
-    def handle_qr_request(self):
-        """Handle QR code generation requests"""
-        if not QR_AVAILABLE:
-            self.send_error(500, "QR code library not installed. Run: pip install qrcode[pil]")
-            return
-        
-        try:
-            # Parse the path: /qr/index or /qr/custom?text=...
-            path_parts = self.path.split('/')
-            if len(path_parts) < 3:
-                self.send_error(400, "Invalid QR request")
-                return
-            
-            qr_type = path_parts[2].split('?')[0]  # Remove query params
-            
-            if qr_type == 'custom':
-                # Handle custom text QR
-                query = urllib.parse.urlparse(self.path).query
-                params = urllib.parse.parse_qs(query)
-                text = params.get('text', [''])[0]
-                if not text:
-                    self.send_error(400, "Missing text parameter")
-                    return
-                self.generate_qr_page(text, "Custom QR Code", "#666666")
-            
-            elif qr_type.isdigit():
-                # Handle preset QR by index
-                index = int(qr_type)
-                qr_data = self.load_qr_data()
-                if not qr_data or index >= len(qr_data['qrCodes']):
-                    self.send_error(404, "QR code not found")
-                    return
-                
-                qr = qr_data['qrCodes'][index]
-                qr_image_path = f"qr-images/qr_{index}.png"
-                self.generate_qr_page(qr['text'], qr['name'], qr['color'], qr_image_path)
-            
-            else:
-                self.send_error(400, "Invalid QR request")
-        
-        except Exception as e:
-            self.send_error(500, f"QR generation error: {str(e)}")
-    
-    def serve_qr_generator_page(self):
-        """Serve the QR generator selection page"""
-        try:
-            qr_data = self.load_qr_data()
-            if not qr_data:
-                self.send_error(500, "Could not load QR data")
-                return
-            
-            html = self.generate_qr_selector_html(qr_data)
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(html.encode())
-        
-        except Exception as e:
-            self.send_error(500, f"Generator page error: {str(e)}")
-    
-    def load_qr_data(self):
-        """Load QR codes from JSON file"""
-        try:
-            with open('qr-data.json', 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading QR data: {e}")
-            return None
-    
-    def generate_qr_page(self, text, name, color, qr_image_path=None):
-        """Generate a single QR code display page"""
-        try:
-            if qr_image_path and os.path.exists(qr_image_path):
-                # Use pre-generated image
-                img_src = f"/{qr_image_path}"
-            else:
-                # Generate QR code on-demand (fallback)
-                qr = qrcode.QRCode(
-                    version=1,
-                    error_correction=qrcode.constants.ERROR_CORRECT_L,
-                    box_size=10,
-                    border=4,
-                )
-                qr.add_data(text)
-                qr.make(fit=True)
-                
-                # Create QR code image
-                img = qr.make_image(fill_color="black", back_color="white")
-                
-                # Convert to base64 for embedding in HTML
-                buffer = io.BytesIO()
-                img.save(buffer, format='PNG')
-                img_str = base64.b64encode(buffer.getvalue()).decode()
-                img_src = f"data:image/png;base64,{img_str}"
-            
-            # Generate HTML page
-            html = f"""
+# Optional faster JSON parser (pip install orjson)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional SIMD base64 (pip install pybase64), same API as the stdlib module
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# Page templates, parsed once at import
+_PAGE_TMPL = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>QR Code: {name}</title>
+    <title>QR Code: ${name}</title>
     <style>
-        body {{
+        body {
             font-family: 'Arial', sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
@@ -165,34 +74,34 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             justify-content: center;
             margin: 0;
             padding: 20px;
-        }}
-        .container {{
+        }
+        .container {
             text-align: center;
             background: rgba(255, 255, 255, 0.1);
             padding: 30px;
             border-radius: 20px;
             backdrop-filter: blur(10px);
             box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-        }}
-        .qr-image {{
+        }
+        .qr-image {
             background: white;
             padding: 20px;
             border-radius: 15px;
             margin: 20px 0;
             display: inline-block;
-        }}
-        .qr-info {{
+        }
+        .qr-info {
             margin: 20px 0;
-        }}
-        .color-indicator {{
+        }
+        .color-indicator {
             width: 40px;
             height: 40px;
             border-radius: 50%;
             margin: 10px auto;
             border: 3px solid white;
-            background-color: {color};
-        }}
-        .back-link {{
+            background-color: ${color};
+        }
+        .back-link {
             color: white;
             text-decoration: none;
             padding: 10px 20px;
@@ -201,30 +110,30 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             transition: all 0.3s ease;
             margin-top: 20px;
             display: inline-block;
-        }}
-        .back-link:hover {{
+        }
+        .back-link:hover {
             background: rgba(255, 255, 255, 0.3);
             transform: translateY(-2px);
-        }}
-        h1 {{ margin-bottom: 10px; }}
-        .text-content {{
+        }
+        h1 { margin-bottom: 10px; }
+        .text-content {
             word-break: break-all;
             background: rgba(255, 255, 255, 0.1);
             padding: 10px;
             border-radius: 10px;
             margin: 10px 0;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
-        <h1>{name}</h1>
+        <h1>${name}</h1>
         <div class="qr-image">
-            <img src="{img_src}" alt="QR Code" />
+            <img src="${img_src}" alt="QR Code" />
         </div>
         <div class="qr-info">
             <div class="color-indicator"></div>
-            <div class="text-content">{text}</div>
+            <div class="text-content">${text}</div>
         </div>
         <a href="/generator" class="back-link">← Back to Generator</a>
         <br><br>
@@ -232,34 +141,9 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     </div>
 </body>
 </html>
-            """
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(html.encode())
-        
-        except Exception as e:
-            self.send_error(500, f"QR generation failed: {str(e)}")
-    
-    def generate_qr_selector_html(self, qr_data):
-        """Generate the QR code selector page"""
-        preset_options = ""
-        preset_grid = ""
-        
-        for i, qr in enumerate(qr_data['qrCodes']):
-            preset_options += f'<option value="{i}">{qr["name"]} - {qr["text"][:30]}{"..." if len(qr["text"]) > 30 else ""}</option>\n'
-            preset_grid += f"""
-            <div class="preset-card" onclick="window.location.href='/qr/{i}'">
-                <div class="preset-info">
-                    <h4>{qr['name']}</h4>
-                    <p>{qr['text']}</p>
-                    <div class="preset-color" style="background-color: {qr['color']};"></div>
-                </div>
-            </div>
-            """
-        
-        return f"""
+""")
+
+_SELECTOR_TMPL = string.Template("""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -267,23 +151,23 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>QR Code Generator</title>
     <style>
-        body {{
+        body {
             font-family: 'Arial', sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             color: white;
             margin: 0;
             padding: 20px;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 800px;
             margin: 0 auto;
-        }}
-        .header {{
+        }
+        .header {
             text-align: center;
             margin-bottom: 30px;
-        }}
-        .back-link {{
+        }
+        .back-link {
             color: white;
             text-decoration: none;
             padding: 10px 20px;
@@ -291,43 +175,43 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             border-radius: 20px;
             transition: all 0.3s ease;
             display: inline-block;
-        }}
-        .back-link:hover {{
+        }
+        .back-link:hover {
             background: rgba(255, 255, 255, 0.3);
             transform: translateY(-2px);
-        }}
-        .controls {{
+        }
+        .controls {
             background: rgba(255, 255, 255, 0.1);
             padding: 20px;
             border-radius: 15px;
             margin-bottom: 30px;
             backdrop-filter: blur(10px);
-        }}
-        select, input, button {{
+        }
+        select, input, button {
             width: 100%;
             padding: 12px;
             margin: 10px 0;
             border: none;
             border-radius: 8px;
             font-size: 16px;
-        }}
-        button {{
+        }
+        button {
             background: linear-gradient(45deg, #ff6b6b, #ee5a52);
             color: white;
             cursor: pointer;
             transition: all 0.3s ease;
-        }}
-        button:hover {{
+        }
+        button:hover {
             transform: translateY(-2px);
             box-shadow: 0 5px 15px rgba(0,0,0,0.3);
-        }}
-        .preset-grid {{
+        }
+        .preset-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
-        .preset-card {{
+        }
+        .preset-card {
             background: rgba(255, 255, 255, 0.1);
             padding: 20px;
             border-radius: 15px;
@@ -335,40 +219,40 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             transition: all 0.3s ease;
             backdrop-filter: blur(10px);
             border: 2px solid transparent;
-        }}
-        .preset-card:hover {{
+        }
+        .preset-card:hover {
             transform: translateY(-5px);
             background: rgba(255, 255, 255, 0.2);
             border-color: rgba(255, 255, 255, 0.3);
-        }}
-        .preset-info h4 {{
+        }
+        .preset-info h4 {
             margin: 0 0 10px 0;
             color: white;
-        }}
-        .preset-info p {{
+        }
+        .preset-info p {
             margin: 0 0 15px 0;
             color: rgba(255, 255, 255, 0.8);
             word-break: break-all;
             font-size: 14px;
-        }}
-        .preset-color {{
+        }
+        .preset-color {
             width: 30px;
             height: 30px;
             border-radius: 50%;
             margin: 0 auto;
             border: 2px solid white;
-        }}
-        .instructions {{
+        }
+        .instructions {
             background: rgba(255, 255, 255, 0.1);
             padding: 20px;
             border-radius: 15px;
             backdrop-filter: blur(10px);
-        }}
-        label {{
+        }
+        label {
             display: block;
             margin-bottom: 8px;
             font-weight: bold;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -382,7 +266,7 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             <label for="qrSelect">Quick Select:</label>
             <select id="qrSelect" onchange="if(this.value) window.location.href='/qr/' + this.value">
                 <option value="">Choose a preset QR code...</option>
-                {preset_options}
+                ${preset_options}
             </select>
             
             <label for="customText">Or Create Custom QR Code:</label>
@@ -391,7 +275,7 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         </div>
         
         <div class="preset-grid">
-            {preset_grid}
+            ${preset_grid}
         </div>
         
         <div class="instructions">
@@ -406,27 +290,365 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     </div>
     
     <script>
-        function generateCustom() {{
+        function generateCustom() {
             const text = document.getElementById('customText').value.trim();
-            if (text) {{
+            if (text) {
                 window.location.href = '/qr/custom?text=' + encodeURIComponent(text);
-            }} else {{
+            } else {
                 alert('Please enter some text first!');
-            }}
-        }}
+            }
+        }
         
-        document.getElementById('customText').addEventListener('keypress', function(e) {{
-            if (e.key === 'Enter') {{
+        document.getElementById('customText').addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
                 generateCustom();
-            }}
-        }});
+            }
+        });
     </script>
 </body>
 </html>
-        """
+""")
+
+# Rendered preset pages, keyed by QR index (filled once at startup)
+_PAGE_CACHE: dict[str, bytes] = {}
+# Gzip-compressed copies of _PAGE_CACHE, same keys
+_PAGE_CACHE_GZ: dict[str, bytes] = {}
+
+# Preset image paths known to exist, filled by generate_all_qr_images
+_GENERATED_FILES: set[str] = set()
+
+def _gzip(body):
+    """Compress a cached response body once, reproducibly (no timestamp)"""
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+def _render_qr_page(text, name, color, img_src):
+    """Render a single QR code display page as UTF-8 bytes, escaping all values"""
+    return _PAGE_TMPL.substitute(
+        name=html.escape(name, quote=True),
+        color=html.escape(color, quote=True),
+        text=html.escape(text, quote=True),
+        img_src=html.escape(img_src, quote=True),
+    ).encode()
+
+# One reusable QRCode per thread (worker processes each get their own)
+_qr_local = threading.local()
+
+def _shared_qr_code():
+    """Return this thread's QRCode instance, reset for a new render"""
+    qr_code = getattr(_qr_local, 'qr_code', None)
+    if qr_code is None:
+        qr_code = _qr_local.qr_code = qrcode.QRCode(
+            version=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            box_size=10,
+            border=4,
+        )
+    else:
+        # clear() keeps the version grown by the last make(fit=True)
+        qr_code.clear()
+        qr_code.version = 1
+    return qr_code
+
+def _qr_png(qr_code, compress_level=6):
+    """Encode a made QRCode as a black-on-white 1-bit PNG"""
+    box_size = qr_code.box_size
+    matrix = qr_code.get_matrix()
+    size = len(matrix) * box_size
+    padding = -size % 8
+    
+    # Pack each module row once (1 = white in PIL mode '1'), then repeat it box_size times
+    rows = []
+    for row in matrix:
+        bits = ''.join('0' * box_size if dark else '1' * box_size for dark in row)
+        packed = int(bits + '1' * padding, 2).to_bytes((size + padding) // 8, 'big')
+        rows.append(packed * box_size)
+    
+    img = Image.frombytes('1', (size, size), b''.join(rows))
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG', optimize=False, compress_level=compress_level)
+    return buffer.getvalue()
+
+@functools.lru_cache(maxsize=64)
+def _render_qr_png(text):
+    """Render an on-demand QR code as PNG bytes, memoized per text"""
+    qr = _shared_qr_code()
+    qr.add_data(text)
+    qr.make(fit=True)
+    
+    # Fast zlib level: rendered while the client waits, and sent only once
+    return _qr_png(qr, compress_level=1)
+
+def _text_param(query):
+    """First non-empty 'text' value of a query string, or ''"""
+    return next((value for key, value in urllib.parse.parse_qsl(query) if key == 'text'), '')
+
+class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections open between the page and its image requests
+    protocol_version = "HTTP/1.1"
+    
+    # Exact paths (query string stripped) and then prefixes, mapped to handler methods
+    _ROUTES = {
+        '/generator': 'serve_qr_generator_page',
+        '/generator/': 'serve_qr_generator_page',
+        '/qr/custom.png': 'handle_qr_png_request',
+    }
+    _PREFIXES = (('/qr/', 'handle_qr_request'),)
+    
+    # Rendered /generator page, set once at startup
+    SELECTOR_HTML = None
+    SELECTOR_HTML_GZ = None
+    
+    # Body queued by send_body, written together with the headers
+    _pending_body = b''
+    
+    # Shared view of _GENERATED_FILES
+    _generated_files = _GENERATED_FILES
+    
+    # Parsed qr-data.json, set once at startup. The cached pages and images are
+    # built from it too, so edits to the file take effect after a restart.
+    _qr_data = None
+    
+    def setup(self):
+        super().setup()
+        # Small responses should not wait on Nagle's algorithm
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    def flush_headers(self):
+        # Ship a queued in-memory body in the same write as the headers
+        if self._pending_body:
+            self._headers_buffer.append(self._pending_body)
+            self._pending_body = b''
+        super().flush_headers()
+    
+    def end_headers(self):
+        # Add CORS headers
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        super().end_headers()
 
-def generate_all_qr_images(qr_data_file='qr-data.json', output_dir='qr-images'):
-    """Generate all QR code images from JSON file on startup"""
+    def log_message(self, format, *args):
+        # Custom log format
+        print(f"[{self.address_string()}] {format % args}")
+    
+    def send_html(self, body, gzip_body=None):
+        """Send an encoded HTML body, or its precompressed copy if the client accepts gzip"""
+        if gzip_body is None:
+            self.send_body(body, 'text/html')
+        elif 'gzip' in self.headers.get('Accept-Encoding', ''):
+            self.send_body(gzip_body, 'text/html', [('Content-Encoding', 'gzip'), ('Vary', 'Accept-Encoding')])
+        else:
+            self.send_body(body, 'text/html', [('Vary', 'Accept-Encoding')])
+    
+    def send_body(self, body, content_type, headers=()):
+        """Send an in-memory response body with an explicit length for keep-alive"""
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for keyword, value in headers:
+            self.send_header(keyword, value)
+        self._pending_body = body
+        self.end_headers()
+    
+    def copyfile(self, source, outputfile):
+        """Send static files with sendfile so the bytes stay in the kernel"""
+        offset = 0
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            size = os.fstat(in_fd).st_size
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (OSError, AttributeError):
+            # No sendfile support (platform, in-memory source or wrapped socket)
+            if offset:
+                raise
+            shutil.copyfileobj(source, outputfile, 64 * 1024)
+    
+    def do_GET(self):
+        # Handle QR generator routes
+        path = self.path.split('?', 1)[0]
+        route = self._ROUTES.get(path)
+        if route is None:
+            for prefix, handler in self._PREFIXES:
+                if path.startswith(prefix):
+                    route = handler
+                    break
+        if route is not None:
+            getattr(self, route)()
+        else:
+            # Default file serving
+            super().do_GET()
+    
+    def handle_qr_request(self):
+        """Handle QR code generation requests"""
+        if not QR_AVAILABLE:
+            self.send_error(500, "QR code library not installed. Run: pip install qrcode[pil]")
+            return
+        
+        try:
+            # Parse the path: /qr/index or /qr/custom?text=...
+            path, _, query = self.path.partition('?')
+            qr_type = path.split('/', 3)[2]
+            
+            if qr_type == 'custom':
+                # Handle custom text QR
+                text = _text_param(query)
+                if not text:
+                    self.send_error(400, "Missing text parameter")
+                    return
+                self.generate_qr_page(text, "Custom QR Code", "#666666")
+            
+            elif qr_type.isdigit() and qr_type in _PAGE_CACHE:
+                # Serve pre-rendered preset page
+                self.send_html(_PAGE_CACHE[qr_type], _PAGE_CACHE_GZ[qr_type])
+            
+            elif qr_type.isdigit():
+                # Handle preset QR by index
+                index = int(qr_type)
+                qr_data = self.load_qr_data()
+                if not qr_data or index >= len(qr_data['qrCodes']):
+                    self.send_error(404, "QR code not found")
+                    return
+                
+                qr = qr_data['qrCodes'][index]
+                qr_image_path = f"qr-images/qr_{index}.png"
+                self.generate_qr_page(qr['text'], qr['name'], qr['color'], qr_image_path)
+            
+            else:
+                self.send_error(400, "Invalid QR request")
+        
+        except Exception as e:
+            self.send_error(500, f"QR generation error: {str(e)}")
+    
+    def handle_qr_png_request(self):
+        """Handle on-demand QR image requests: /qr/custom.png?text=..."""
+        if not QR_AVAILABLE:
+            self.send_error(500, "QR code library not installed. Run: pip install qrcode[pil]")
+            return
+        
+        try:
+            text = _text_param(self.path.partition('?')[2])
+            if not text:
+                self.send_error(400, "Missing text parameter")
+                return
+            
+            self.send_body(_render_qr_png(text), 'image/png')
+        
+        except Exception as e:
+            self.send_error(500, f"QR generation error: {str(e)}")
+    
+    def serve_qr_generator_page(self):
+        """Serve the QR generator selection page"""
+        try:
+            if self.SELECTOR_HTML is None:
+                qr_data = self.load_qr_data()
+                if not qr_data:
+                    self.send_error(500, "Could not load QR data")
+                    return
+                selector_html = self.generate_qr_selector_html(qr_data).encode()
+                type(self).SELECTOR_HTML_GZ = _gzip(selector_html)
+                type(self).SELECTOR_HTML = selector_html
+            
+            self.send_html(self.SELECTOR_HTML, self.SELECTOR_HTML_GZ)
+        
+        except Exception as e:
+            self.send_error(500, f"Generator page error: {str(e)}")
+    
+    def load_qr_data(self):
+        """Return QR codes parsed from the JSON file, loading it on first use"""
+        try:
+            if self._qr_data is None:
+                with open('qr-data.json', 'r') as f:
+                    type(self)._qr_data = _json_loads(f.read())
+            return self._qr_data
+        except Exception as e:
+            print(f"Error loading QR data: {e}")
+            return None
+    
+    def generate_qr_page(self, text, name, color, qr_image_path=None):
+        """Generate a single QR code display page"""
+        try:
+            if qr_image_path in self._generated_files:
+                # Use pre-generated image
+                img_src = f"/{qr_image_path}"
+            else:
+                # Render QR code on-demand through the PNG endpoint (fallback)
+                img_src = f"/qr/custom.png?{urllib.parse.urlencode({'text': text})}"
+            
+            body = _render_qr_page(text, name, color, img_src)
+            
+            self.send_html(body)
+        
+        except Exception as e:
+            self.send_error(500, f"QR generation failed: {str(e)}")
+    
+    @staticmethod
+    def generate_qr_selector_html(qr_data):
+        """Generate the QR code selector page"""
+        preset_options = ""
+        preset_grid = ""
+        
+        for i, qr in enumerate(qr_data['qrCodes']):
+            name = html.escape(qr['name'], quote=True)
+            text = html.escape(qr['text'], quote=True)
+            color = html.escape(qr['color'], quote=True)
+            short_text = html.escape(qr['text'][:30], quote=True) + ("..." if len(qr['text']) > 30 else "")
+            preset_options += f'<option value="{i}" title="{text}">{name} - {short_text}</option>\n'
+            preset_grid += f"""
+            <div class="preset-card" onclick="window.location.href='/qr/{i}'">
+                <div class="preset-info">
+                    <h4>{name}</h4>
+                    <p>{text}</p>
+                    <div class="preset-color" style="background-color: {color};"></div>
+                </div>
+            </div>
+            """
+        
+        return _SELECTOR_TMPL.substitute(preset_options=preset_options, preset_grid=preset_grid)
+
+def _qr_hash(qr):
+    """Stable content key for a preset, used to skip unchanged images"""
+    key = "\0".join((qr['text'], qr['color'], qr['name']))
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+def _render_one(args):
+    """Render one preset QR image; runs in a worker process"""
+    i, qr, output_dir = args
+    try:
+        # Generate QR code
+        qr_code = _shared_qr_code()
+        qr_code.add_data(qr['text'])
+        qr_code.make(fit=True)
+        
+        # Save image
+        img_path = os.path.join(output_dir, f"qr_{i}.png")
+        with open(img_path, 'wb') as f:
+            f.write(_qr_png(qr_code))
+        return i, "", True
+    
+    except Exception as e:
+        return i, str(e), False
+
+# Below this many images, worker start-up costs more than it saves
+_PARALLEL_MIN_JOBS = 16
+
+def _render_jobs(jobs):
+    """Render preset images, in a process pool when there are enough of them"""
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1 and len(jobs) >= _PARALLEL_MIN_JOBS:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_render_one, jobs))
+        except (BrokenProcessPool, OSError) as e:
+            print(f"⚠️  Process pool unavailable ({e}), rendering serially")
+    return [_render_one(job) for job in jobs]
+
+def generate_all_qr_images(qr_data, output_dir='qr-images'):
+    """Generate all QR code images from the parsed QR data on startup"""
     print("🎯 Pre-generating QR code images...")
     
     if not QR_AVAILABLE:
@@ -434,44 +656,62 @@ def generate_all_qr_images(qr_data_file='qr-data.json', output_dir='qr-images'):
         return False
     
     try:
-        # Clean existing directory
-        if os.path.exists(output_dir):
-            shutil.rmtree(output_dir)
-            print(f"🧹 Cleaned existing {output_dir} directory")
-        
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Load QR data
-        with open(qr_data_file, 'r') as f:
-            qr_data = json.load(f)
+        # Load manifest from the previous run
+        manifest_path = os.path.join(output_dir, '.manifest.json')
+        try:
+            with open(manifest_path, 'r') as f:
+                old_manifest = _json_loads(f.read())
+        except (OSError, ValueError):
+            old_manifest = {}
         
-        generated_count = 0
+        # Only render entries whose content changed or whose image is missing
+        manifest = {}
+        jobs = []
         for i, qr in enumerate(qr_data['qrCodes']):
-            try:
-                # Generate QR code
-                qr_code = qrcode.QRCode(
-                    version=1,
-                    error_correction=qrcode.constants.ERROR_CORRECT_L,
-                    box_size=10,
-                    border=4,
-                )
-                qr_code.add_data(qr['text'])
-                qr_code.make(fit=True)
-                
-                # Create QR code image
-                img = qr_code.make_image(fill_color="black", back_color="white")
-                
-                # Save image
-                img_path = os.path.join(output_dir, f"qr_{i}.png")
-                img.save(img_path)
-                
+            entry = {"hash": _qr_hash(qr), "file": f"qr_{i}.png"}
+            manifest[str(i)] = entry
+            img_path = os.path.join(output_dir, entry['file'])
+            if old_manifest.get(str(i)) != entry or not os.path.exists(img_path):
+                # Drop the outdated image so a failed render can't leave it behind
+                if os.path.exists(img_path):
+                    os.remove(img_path)
+                jobs.append((i, qr, output_dir))
+        
+        # Remove images that no longer belong to any preset
+        current_files = {entry['file'] for entry in manifest.values()}
+        for filename in os.listdir(output_dir):
+            if filename.startswith('qr_') and filename.endswith('.png') and filename not in current_files:
+                os.remove(os.path.join(output_dir, filename))
+                print(f"🧹 Removed stale {filename}")
+        
+        results = _render_jobs(jobs)
+        
+        generated_count = 0
+        for (i, qr, _), (_, error, ok) in zip(jobs, results):
+            if ok:
                 print(f"   ✅ Generated QR {i}: {qr['name']}")
                 generated_count += 1
-                
-            except Exception as e:
-                print(f"   ❌ Failed to generate QR {i} ({qr['name']}): {e}")
+            else:
+                # Leave it out of the manifest so the next start retries it
+                del manifest[str(i)]
+                img_path = os.path.join(output_dir, f"qr_{i}.png")
+                if os.path.exists(img_path):
+                    os.remove(img_path)
+                print(f"   ❌ Failed to generate QR {i} ({qr['name']}): {error}")
         
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        
+        # Remember which images exist so handlers can skip the stat() call
+        _GENERATED_FILES.clear()
+        _GENERATED_FILES.update(f"{output_dir}/{entry['file']}" for entry in manifest.values())
+        
+        reused_count = len(qr_data['qrCodes']) - len(jobs)
+        if reused_count:
+            print(f"♻️  Reused {reused_count} unchanged QR code images")
         print(f"🎉 Generated {generated_count} QR code images in {output_dir}/")
         return True
         
@@ -479,6 +719,34 @@ def generate_all_qr_images(qr_data_file='qr-data.json', output_dir='qr-images'):
         print(f"❌ Failed to generate QR images: {e}")
         return False
 
+def cache_qr_pages(qr_data, output_dir='qr-images'):
+    """Render preset QR pages and the generator page once so requests can be served from memory"""
+    try:
+        _PAGE_CACHE.clear()
+        _PAGE_CACHE_GZ.clear()
+        for i, qr in enumerate(qr_data['qrCodes']):
+            qr_image_path = f"{output_dir}/qr_{i}.png"
+            if qr_image_path not in _GENERATED_FILES:
+                continue
+            
+            # Inline the image so a preset scan needs a single request
+            with open(qr_image_path, 'rb') as f:
+                img_src = "data:image/png;base64," + _b64.b64encode(f.read()).decode('ascii')
+            page = _render_qr_page(qr['text'], qr['name'], qr['color'], img_src)
+            _PAGE_CACHE_GZ[str(i)] = _gzip(page)
+            _PAGE_CACHE[str(i)] = page
+        
+        selector_html = CustomHTTPRequestHandler.generate_qr_selector_html(qr_data).encode()
+        CustomHTTPRequestHandler.SELECTOR_HTML_GZ = _gzip(selector_html)
+        CustomHTTPRequestHandler.SELECTOR_HTML = selector_html
+        
+        print(f"📦 Cached {len(_PAGE_CACHE)} QR pages and generator page")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Failed to cache QR pages: {e}")
+        return False
+
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='QR Scanner Server with QR Generation')
@@ -503,12 +771,24 @@ def main():
         print("Make sure all files are in the same directory as server.py")
         sys.exit(1)
     
+    # Load QR data once and keep it in memory for request handlers
+    try:
+        with open('qr-data.json', 'r') as f:
+            qr_data = _json_loads(f.read())
+    except Exception as e:
+        print(f"❌ Could not load qr-data.json: {e}")
+        sys.exit(1)
+    CustomHTTPRequestHandler._qr_data = qr_data
+    
     # Pre-generate all QR code images
-    generate_all_qr_images()
+    generate_all_qr_images(qr_data)
+    
+    # Pre-render preset and generator pages
+    cache_qr_pages(qr_data)
     
-    # Create server
+    # Create server (one thread per connection)
     try:
-        with socketserver.TCPServer((HOST, PORT), CustomHTTPRequestHandler) as httpd:
+        with http.server.ThreadingHTTPServer((HOST, PORT), CustomHTTPRequestHandler) as httpd:
             # Display URLs
             if HOST in ['0.0.0.0', '']:
                 local_url = f"http://localhost:{PORT}"
@@ -527,6 +807,7 @@ def main():
             print(f"\n🌐 Local access: {local_url}")
             if HOST in ['0.0.0.0', '']:
                 print(f"📱 Network access: {network_url}")
+            print("💡 Restart the server after editing qr-data.json")
             print("\n⏹️  Press Ctrl+C to stop the server\n")
             
             # Try to open browser automatically